@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Builds the optional Cython extension used by src/sandhi_splitter.py.
+
+Usage:
+    pip install cython
+    python setup.py build_ext --inplace
+
+"""
+
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+setup(
+    name="telugu_tokenizer",
+    package_dir={"": "src"},
+    ext_modules=cythonize(
+        [Extension("_sandhi", ["src/_sandhi.pyx"])],
+        language_level=3,
+    ),
+)
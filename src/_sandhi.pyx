@@ -0,0 +1,47 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled Helpers for sandhi_splitter
+------------------------------------
+Optional C build of the consonant-cluster scan. Build it in place with:
+
+    python setup.py build_ext --inplace
+
+sandhi_splitter falls back to its pure-Python scan when this is not built.
+
+"""
+
+cdef class ClusterScanner:
+    """Callable equivalent of sandhi_splitter._precompute_cluster_starts."""
+    cdef Py_ssize_t low, high
+    cdef Py_UCS4 virama
+    cdef bytes flags
+
+    def __init__(self, unicode consonants, unicode virama):
+        self.low = ord(min(consonants))
+        self.high = ord(max(consonants))
+        self.virama = ord(virama)
+        table = bytearray(self.high - self.low + 1)
+        for char in consonants:
+            table[ord(char) - self.low] = 1
+        self.flags = bytes(table)
+
+    def __call__(self, unicode word):
+        cdef Py_ssize_t n = len(word)
+        cdef Py_ssize_t i
+        cdef Py_ssize_t last_valid = -1
+        cdef Py_ssize_t code
+        cdef Py_UCS4 current_char
+        cdef Py_UCS4 prev_char = 0
+        cdef const unsigned char* flags = self.flags
+        cdef list cluster_start = [-1] * n
+        for i in range(n - 1):
+            current_char = word[i]
+            code = <Py_ssize_t>current_char
+            if self.low <= code <= self.high and flags[code - self.low]:
+                if prev_char != self.virama:
+                    last_valid = i
+            elif current_char != self.virama:
+                last_valid = -1
+            cluster_start[i + 1] = last_valid
+            prev_char = current_char
+        return cluster_start
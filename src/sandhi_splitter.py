@@ -6,6 +6,8 @@ A rule-based engine to split Telugu words based on grammatical Sandhi rules.
 
 """
 
+import re
+
 # Telugu Character Definitions
 TELUGU_CONSONANTS = "కఖగఘఙచఛజఝఞటఠడఢణతథదధనపఫబభమయరలవశషసహళక్షఱ"
 VIRAMA = '్'
@@ -16,13 +18,55 @@ MATRA_MAP = {
 }
 VOWEL_TO_MATRA = {v: k for k, v in MATRA_MAP.items()}
 
+# Set views for O(1) per-character membership tests
+TELUGU_CONSONANTS_SET = frozenset(TELUGU_CONSONANTS)
+VOWELS_SET = frozenset(VOWELS)
+MATRA_SET = frozenset(MATRA_MAP)
+
+# Rule tables
+_SAVARNA_MAP = {'ా': ('అ', ''), 'ీ': ('ఇ', 'ి'), 'ూ': ('ఉ', 'ు'), 'ౄ': ('ఋ', 'ృ')}
+_ELIDED_MATRAS = (('ు', 'ఉ'), ('ి', 'ఇ'))
+_GASADA_REV = {'గ': 'క', 'స': 'చ', 'డ': 'ట', 'ద': 'త', 'వ': 'ప'}
+_TRIKA_VOWELS = {'అ': 'ఆ', 'ఇ': 'ఈ', 'ఎ': 'ఏ'}
+_GUNA_MAP = {'ే': ('ఇ', 'ఈ'), 'ో': ('ఉ', 'ఊ')}
+_VRIDDHI_MAP = {'ై': ('ఏ', 'ఐ'), 'ౌ': ('ఓ', 'ఔ')}
+_JASHTVA_REV = {'గ': 'క', 'జ': 'చ', 'డ': 'ట', 'ద': 'త', 'బ': 'ప'}
+_ANUNASIKA_REV = {'ఙ': 'క', 'ఞ': 'చ', 'ణ': 'ట', 'న': 'త', 'మ': 'ప'}
+
+# Trigger scanners: each rule body runs only at positions its pattern matches
+_SAVARNADEERGHA_TRIGGERS = re.compile('[%s]' % ''.join(_SAVARNA_MAP))
+_UTVA_IKARA_TRIGGERS = re.compile('[%s]' % ''.join(MATRA_MAP))
+_YADAGAMA_TRIGGERS = re.compile('య')
+_GASADA_DAVA_TRIGGERS = re.compile('[%s]' % ''.join(_GASADA_REV))
+_GUNA_TRIGGERS = re.compile('[%s]' % ''.join(_GUNA_MAP))
+_VRIDDHI_TRIGGERS = re.compile('[%s]' % ''.join(_VRIDDHI_MAP))
+_YANADESA_TRIGGERS = re.compile('్[యవర]')
+_JASHTVA_TRIGGERS = re.compile('[%s]' % ''.join(_JASHTVA_REV))
+_ANUNASIKA_TRIGGERS = re.compile('[%s]్' % ''.join(_ANUNASIKA_REV))
+
+# Characters a word must contain for a rule to produce any split.
+# Rules without an entry are always run.
+_RULE_TRIGGERS = {
+    "savarnadeergha": frozenset(_SAVARNA_MAP),
+    "guna": frozenset(_GUNA_MAP),
+    "vriddhi": frozenset(_VRIDDHI_MAP),
+    "yanadesa": frozenset(VIRAMA),
+    "utva_ikara": MATRA_SET,
+    "yadagama": frozenset('య'),
+    "gasada_dava": frozenset(_GASADA_REV),
+    "trika": frozenset(_TRIKA_VOWELS),
+    "jashtva": frozenset(_JASHTVA_REV),
+    "schutva": frozenset('చశ'),
+    "anunasika": frozenset(VIRAMA),
+}
+
 def find_consonant_cluster_start(word, end_index):
     """Helper to find the start of a consonant cluster before a given index."""
     start_index = -1
     j = end_index - 1
     while j >= 0:
         current_char = word[j]
-        if current_char in TELUGU_CONSONANTS:
+        if current_char in TELUGU_CONSONANTS_SET:
             if j == 0 or word[j-1] != VIRAMA:
                 start_index = j
                 break
@@ -31,213 +75,252 @@ def find_consonant_cluster_start(word, end_index):
         j -= 1
     return start_index
 
+def _precompute_cluster_starts(word):
+    """
+    Computes find_consonant_cluster_start(word, i) for every index in one pass.
+    Entry i is the start of the consonant cluster ending just before word[i], or -1.
+    """
+    cluster_start = [-1] * len(word)
+    last_valid = -1
+    prev_char = ''
+    for i, current_char in enumerate(word[:-1], 1):
+        if current_char in TELUGU_CONSONANTS_SET:
+            if prev_char != VIRAMA:
+                last_valid = i - 1
+        elif current_char != VIRAMA:
+            last_valid = -1
+        cluster_start[i] = last_valid
+        prev_char = current_char
+    return cluster_start
+
+# Use the compiled scan when the optional Cython extension has been built
+try:
+    from _sandhi import ClusterScanner
+except ImportError:
+    pass
+else:
+    _precompute_cluster_starts = ClusterScanner(TELUGU_CONSONANTS, VIRAMA)
+
 # --- Sandhi Rules ---
 
-def split_savarnadeergha(word):
+def split_savarnadeergha(word, cluster_start=None):
     """Splits word based on Savarnadeergha Sandhi."""
-    sandhi_map = {'ా': ('అ', ''), 'ీ': ('ఇ', 'ి'), 'ూ': ('ఉ', 'ు'), 'ౄ': ('ఋ', 'ృ')}
-    splits = []
-    for i, char in enumerate(word):
-        if char in sandhi_map:
-            start_of_cluster = find_consonant_cluster_start(word, i)
-            if start_of_cluster != -1:
-                short_vowel_char, short_matra = sandhi_map[char]
-                prefix = word[:start_of_cluster]
-                consonant = word[start_of_cluster:i]
-                word1 = prefix + consonant + short_matra if short_matra else prefix + consonant
-                word2 = short_vowel_char + word[i+1:]
-                splits.append(f"'{word1}' + '{word2}'")
+    if cluster_start is None:
+        cluster_start = _precompute_cluster_starts(word)
+    splits = set()
+    for match in _SAVARNADEERGHA_TRIGGERS.finditer(word):
+        i = match.start()
+        start_of_cluster = cluster_start[i]
+        if start_of_cluster != -1:
+            short_vowel_char, short_matra = _SAVARNA_MAP[word[i]]
+            # The consonant cluster ends at i, so word1 is everything before the long matra
+            word1 = word[:i] + short_matra
+            word2 = short_vowel_char + word[i+1:]
+            splits.add((word1, word2))
     return splits
 
-def split_utva_ikara_sandhi(word):
+def split_utva_ikara_sandhi(word, cluster_start=None):
     """Splits word based on Utva/Ikara Sandhi."""
-    splits = []
-    possible_elided_matras = {'ు': 'ఉ', 'ి': 'ఇ'}
-    for i in range(1, len(word)):
-        current_char = word[i]
-        if current_char in MATRA_MAP:
-            start_of_cluster = find_consonant_cluster_start(word, i)
-            if start_of_cluster != -1:
-                prefix = word[:start_of_cluster]
-                consonant = word[start_of_cluster:i]
-                word2_start_vowel = MATRA_MAP[current_char]
-                word2 = word2_start_vowel + word[i+1:]
-                for matra, vowel in possible_elided_matras.items():
-                    word1 = prefix + consonant + matra
-                    splits.append(f"'{word1}' + '{word2}'")
+    if cluster_start is None:
+        cluster_start = _precompute_cluster_starts(word)
+    splits = set()
+    for match in _UTVA_IKARA_TRIGGERS.finditer(word, 1):
+        i = match.start()
+        start_of_cluster = cluster_start[i]
+        if start_of_cluster != -1:
+            stem = word[:i]
+            word2_start_vowel = MATRA_MAP[word[i]]
+            word2 = word2_start_vowel + word[i+1:]
+            for matra, vowel in _ELIDED_MATRAS:
+                word1 = stem + matra
+                splits.add((word1, word2))
     return splits
 
 def split_yadagama_sandhi(word):
     """Splits word based on Yadagama Sandhi."""
-    splits = []
-    for i in range(1, len(word) - 1):
-        if word[i] == 'య' and i > 1 and word[i-1] == 'ి' and word[i-2] in TELUGU_CONSONANTS:
-            if (i + 1 < len(word)) and (word[i+1] not in MATRA_MAP and word[i+1] in TELUGU_CONSONANTS):
-                 word1 = word[:i]
-                 word2 = "అ" + word[i+1:]
-                 splits.append(f"'{word1}' + '{word2}'")
-            elif (i + 1 < len(word)) and word[i+1] in MATRA_MAP:
-                 word1 = word[:i]
-                 word2 = MATRA_MAP[word[i+1]] + word[i+2:]
-                 splits.append(f"'{word1}' + '{word2}'")
+    splits = set()
+    for match in _YADAGAMA_TRIGGERS.finditer(word, 2, len(word) - 1):
+        i = match.start()
+        if word[i-1] == 'ి' and word[i-2] in TELUGU_CONSONANTS_SET:
+            if word[i+1] not in MATRA_SET and word[i+1] in TELUGU_CONSONANTS_SET:
+                word1 = word[:i]
+                word2 = "అ" + word[i+1:]
+                splits.add((word1, word2))
+            elif word[i+1] in MATRA_SET:
+                word1 = word[:i]
+                word2 = MATRA_MAP[word[i+1]] + word[i+2:]
+                splits.add((word1, word2))
     return splits
 
 def split_amredita_sandhi(word):
     """Splits word based on Amredita Sandhi."""
-    splits = []
+    splits = set()
     mid = len(word) // 2
     if len(word) > 1 and len(word) % 2 == 0 and word[:mid] == word[mid:]:
-        splits.append(f"'{word[:mid]}' + '{word[mid:]}'")
+        splits.add((word[:mid], word[mid:]))
     return splits
 
-def split_gasada_dava_adesa(word):
+def split_gasada_dava_adesa(word, cluster_start=None):
     """Splits word based on Gasadadava Adesa Sandhi."""
-    splits = []
-    reverse_map = {'గ': 'క', 'స': 'చ', 'డ': 'ట', 'ద': 'త', 'వ': 'ప'}
-    for i, char in enumerate(word):
-        if char in reverse_map:
-            start_of_cluster = find_consonant_cluster_start(word, i)
-            if start_of_cluster != -1:
-                word1_candidate = word[:start_of_cluster]
-                if len(word1_candidate) > 1:
-                    word1 = word1_candidate
-                    original_consonant = reverse_map[char]
-                    suffix = word[start_of_cluster:]
-                    word2 = original_consonant + suffix[1:]
-                    splits.append(f"'{word1}' + '{word2}'")
+    if cluster_start is None:
+        cluster_start = _precompute_cluster_starts(word)
+    splits = set()
+    for match in _GASADA_DAVA_TRIGGERS.finditer(word):
+        i = match.start()
+        start_of_cluster = cluster_start[i]
+        if start_of_cluster != -1:
+            word1_candidate = word[:start_of_cluster]
+            if len(word1_candidate) > 1:
+                word1 = word1_candidate
+                original_consonant = _GASADA_REV[word[i]]
+                word2 = original_consonant + word[start_of_cluster+1:]
+                splits.add((word1, word2))
     return splits
 
 def split_trika(word):
     """Splits word based on Trika Sandhi."""
-    splits = []
-    trika_vowels = {'అ': 'ఆ', 'ఇ': 'ఈ', 'ఎ': 'ఏ'}
-    if len(word) > 3 and word[0] in trika_vowels:
+    splits = set()
+    if len(word) > 3 and word[0] in _TRIKA_VOWELS:
         if word[2] == '్' and word[1] == word[3]:
-            word1 = trika_vowels[word[0]]
+            word1 = _TRIKA_VOWELS[word[0]]
             word2 = word[3:]
-            splits.append(f"'{word1}' + '{word2}'")
+            splits.add((word1, word2))
     return splits
 
-def split_guna(word):
+def split_guna(word, cluster_start=None):
     """Splits word based on Guna Sandhi."""
-    sandhi_map = {'ే': ('ఇ', 'ఈ'), 'ో': ('ఉ', 'ఊ')}
-    splits = []
-    for i, char in enumerate(word):
-        if char in sandhi_map:
-            start_of_cluster = find_consonant_cluster_start(word, i)
-            if start_of_cluster != -1:
-                prefix = word[:start_of_cluster]
-                consonant = word[start_of_cluster:i]
-                word1_a = prefix + consonant
-                vowel1, vowel2 = sandhi_map[char]
-                suffix = word[i+1:]
-                splits.append(f"'{word1_a}' + '{vowel1 + suffix}'")
-                splits.append(f"'{word1_a}' + '{vowel2 + suffix}'")
+    if cluster_start is None:
+        cluster_start = _precompute_cluster_starts(word)
+    splits = set()
+    for match in _GUNA_TRIGGERS.finditer(word):
+        i = match.start()
+        start_of_cluster = cluster_start[i]
+        if start_of_cluster != -1:
+            word1_a = word[:i]
+            vowel1, vowel2 = _GUNA_MAP[word[i]]
+            suffix = word[i+1:]
+            splits.add((word1_a, vowel1 + suffix))
+            splits.add((word1_a, vowel2 + suffix))
     return splits
 
-def split_vriddhi(word):
+def split_vriddhi(word, cluster_start=None):
     """Splits word based on Vriddhi Sandhi."""
-    sandhi_map = {'ై': ('ఏ', 'ఐ'), 'ౌ': ('ఓ', 'ఔ')}
-    splits = []
-    for i, char in enumerate(word):
-        if char in sandhi_map:
-            start_of_cluster = find_consonant_cluster_start(word, i)
-            if start_of_cluster != -1:
-                prefix = word[:start_of_cluster]
-                consonant = word[start_of_cluster:i]
-                word1_a = prefix + consonant
-                vowel1, vowel2 = sandhi_map[char]
-                suffix = word[i+1:]
-                splits.append(f"'{word1_a}' + '{vowel1 + suffix}'")
-                splits.append(f"'{word1_a}' + '{vowel2 + suffix}'")
+    if cluster_start is None:
+        cluster_start = _precompute_cluster_starts(word)
+    splits = set()
+    for match in _VRIDDHI_TRIGGERS.finditer(word):
+        i = match.start()
+        start_of_cluster = cluster_start[i]
+        if start_of_cluster != -1:
+            word1_a = word[:i]
+            vowel1, vowel2 = _VRIDDHI_MAP[word[i]]
+            suffix = word[i+1:]
+            splits.add((word1_a, vowel1 + suffix))
+            splits.add((word1_a, vowel2 + suffix))
     return splits
 
 def split_yanadesa(word):
     """Splits word based on Yanadesa Sandhi."""
-    splits = []
-    for i in range(1, len(word)):
-        if word[i] == '్' and i + 1 < len(word):
-            base_consonant_char = word[i-1]
-            adesa_char = word[i+1]
-
-            original_matra = None
-            if adesa_char == 'య': original_matra = 'ి'
-            elif adesa_char == 'వ': original_matra = 'ు'
-            elif adesa_char == 'ర': original_matra = 'ృ'
-
-            if original_matra:
-                cluster_and_matra = word[i+2:]
-                next_char = cluster_and_matra[0] if cluster_and_matra else ''
-                vowel_sound = MATRA_MAP.get(next_char, 'అ')
-
-                word1 = word[:i-1] + base_consonant_char + original_matra
-                word2 = vowel_sound + (cluster_and_matra[1:] if next_char in MATRA_MAP else cluster_and_matra)
-                splits.append(f"'{word1}' + '{word2}'")
+    splits = set()
+    for match in _YANADESA_TRIGGERS.finditer(word, 1):
+        i = match.start()
+        adesa_char = word[i+1]
+
+        original_matra = None
+        if adesa_char == 'య': original_matra = 'ి'
+        elif adesa_char == 'వ': original_matra = 'ు'
+        elif adesa_char == 'ర': original_matra = 'ృ'
+
+        cluster_and_matra = word[i+2:]
+        next_char = cluster_and_matra[0] if cluster_and_matra else ''
+        vowel_sound = MATRA_MAP.get(next_char, 'అ')
+
+        word1 = word[:i] + original_matra
+        word2 = vowel_sound + (cluster_and_matra[1:] if next_char in MATRA_SET else cluster_and_matra)
+        splits.add((word1, word2))
     return splits
 
 def split_jashtva(word):
     """Splits word based on Jashtva Sandhi."""
-    splits = []
-    reverse_map = {'గ': 'క', 'జ': 'చ', 'డ': 'ట', 'ద': 'త', 'బ': 'ప'}
-    for i, char in enumerate(word):
-        if char in reverse_map:
-            vowel_of_char = 'అ'
-            suffix_start_index = i + 1
-            if i + 1 < len(word) and word[i+1] in MATRA_MAP:
-                vowel_of_char = MATRA_MAP[word[i+1]]
-                suffix_start_index = i + 2
-
-            word1 = word[:i] + reverse_map[char] + VIRAMA
-            word2 = vowel_of_char + word[suffix_start_index:]
-            splits.append(f"'{word1}' + '{word2}'")
+    splits = set()
+    for match in _JASHTVA_TRIGGERS.finditer(word):
+        i = match.start()
+        vowel_of_char = 'అ'
+        suffix_start_index = i + 1
+        if i + 1 < len(word) and word[i+1] in MATRA_SET:
+            vowel_of_char = MATRA_MAP[word[i+1]]
+            suffix_start_index = i + 2
+
+        word1 = word[:i] + _JASHTVA_REV[word[i]] + VIRAMA
+        word2 = vowel_of_char + word[suffix_start_index:]
+        splits.add((word1, word2))
     return splits
 
 def split_schutva(word):
     """Splits word based on Schutva Sandhi."""
-    splits = []
-    if 'చ్చ' in word:
-        index = word.find('చ్చ')
+    splits = set()
+    index = word.find('చ్చ')
+    if index != -1:
         word1 = word[:index] + 'త్'
         word2 = 'చ' + word[index+2:]
-        splits.append(f"'{word1}' + '{word2}'")
-    if 'శ్శ' in word:
-        index = word.find('శ్శ')
+        splits.add((word1, word2))
+    index = word.find('శ్శ')
+    if index != -1:
         word1 = word[:index] + 'స్'
         word2 = 'శ' + word[index+2:]
-        splits.append(f"'{word1}' + '{word2}'")
+        splits.add((word1, word2))
     return splits
 
 def split_anunasika(word):
     """Splits word based on Anunasika Sandhi."""
-    splits = []
-    reverse_map = {'ఙ': 'క', 'ఞ': 'చ', 'ణ': 'ట', 'న': 'త', 'మ': 'ప'}
-    for i in range(1, len(word)):
-        if word[i] == '్' and word[i-1] in reverse_map:
-            nasal = word[i-1]
-            word1 = word[:i-1] + reverse_map[nasal] + VIRAMA
-            word2 = word[i+1:]
-            splits.append(f"'{word1}' + '{word2}'")
-    if 'న్న' in word:
-        index = word.find('న్న')
+    splits = set()
+    for match in _ANUNASIKA_TRIGGERS.finditer(word):
+        i = match.start() + 1
+        nasal = word[i-1]
+        word1 = word[:i-1] + _ANUNASIKA_REV[nasal] + VIRAMA
+        word2 = word[i+1:]
+        splits.add((word1, word2))
+    index = word.find('న్న')
+    if index != -1:
         word1 = word[:index] + 'త్'
         word2 = 'న' + word[index+2:]
-        splits.append(f"'{word1}' + '{word2}'")
+        splits.add((word1, word2))
     return splits
 
+# Rules in application order: (name, function, takes the cluster-start table)
+_RULES = (
+    ("savarnadeergha", split_savarnadeergha, True),
+    ("guna", split_guna, True),
+    ("vriddhi", split_vriddhi, True),
+    ("yanadesa", split_yanadesa, False),
+    ("utva_ikara", split_utva_ikara_sandhi, True),
+    ("yadagama", split_yadagama_sandhi, False),
+    ("gasada_dava", split_gasada_dava_adesa, True),
+    ("amredita", split_amredita_sandhi, False),
+    ("trika", split_trika, False),
+    ("jashtva", split_jashtva, False),
+    ("schutva", split_schutva, False),
+    ("anunasika", split_anunasika, False),
+)
+
+def iter_splits(word):
+    """
+    Lazily applies the Sandhi rules to the input word in _RULES order.
+    Yields (rule name, set of (part1, part2) tuples) for each rule that splits it.
+    """
+    cluster_start = _precompute_cluster_starts(word)
+    present = set(word)
+    for name, rule, uses_clusters in _RULES:
+        triggers = _RULE_TRIGGERS.get(name)
+        if triggers is not None and triggers.isdisjoint(present):
+            continue
+        splits = rule(word, cluster_start) if uses_clusters else rule(word)
+        if splits:
+            yield name, splits
+
 def find_all_splits(word):
-    """Executes all defined Sandhi functions on the input word."""
-    all_splits = {
-        "savarnadeergha": split_savarnadeergha(word),
-        "guna": split_guna(word),
-        "vriddhi": split_vriddhi(word),
-        "yanadesa": split_yanadesa(word),
-        "utva_ikara": split_utva_ikara_sandhi(word),
-        "yadagama": split_yadagama_sandhi(word),
-        "gasada_dava": split_gasada_dava_adesa(word),
-        "amredita": split_amredita_sandhi(word),
-        "trika": split_trika(word),
-        "jashtva": split_jashtva(word),
-        "schutva": split_schutva(word),
-        "anunasika": split_anunasika(word),
-    }
-    return {k: list(set(v)) for k, v in all_splits.items() if v}
\ No newline at end of file
+    """
+    Executes all defined Sandhi functions on the input word.
+    Returns a dict mapping rule name to a list of (part1, part2) tuples.
+    """
+    return {name: list(splits) for name, splits in iter_splits(word)}
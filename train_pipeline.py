@@ -15,16 +15,25 @@ Usage:
 import os
 import sys
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 import sentencepiece as spm
 
 # Add 'src' to path to import the module
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 try:
-    from sandhi_splitter import find_all_splits
+    from sandhi_splitter import iter_splits
 except ImportError:
     print("Error: Could not import 'src.sandhi_splitter'. Ensure the folder structure is correct.")
     sys.exit(1)
 
+# Per-process state for pre-tokenization workers. Corpus words repeat heavily,
+# so each worker splits a distinct word only once.
+_worker_vocab = None
+_worker_accept_score = None
+_worker_split_cache = {}
+
 def load_vocabulary_with_frequency(filepath):
     """
     Loads vocabulary and frequency counts from a text file.
@@ -39,42 +48,55 @@ def load_vocabulary_with_frequency(filepath):
             line = line.strip()
             if not line:
                 continue
-            parts = line.split()
-            if len(parts) >= 2:
-                word = ' '.join(parts[:-1])
-                freq_str = parts[-1]
-                vocab[word] = int(freq_str) if freq_str.isdigit() else 1
+            parts = line.rsplit(None, 1)
+            if len(parts) == 2:
+                word, freq_str = parts
+                try:
+                    freq = int(freq_str)
+                except ValueError:
+                    freq = 1
+                # Negative counts would drag split scores down, so treat them as unknown
+                vocab[sys.intern(word)] = freq if freq >= 0 else 1
             else:
-                vocab[line] = 1
+                vocab[sys.intern(line)] = 1
     print(f"[INFO] Loaded {len(vocab)} words.")
     return vocab
 
-def get_best_frequency_split(word, vocab):
+def get_best_frequency_split(word, vocab, accept_score=None):
     """
     Validates Sandhi splits against the vocabulary frequency.
-    Returns the split with the highest frequency score.
+    Returns the split with the highest frequency score. If accept_score is
+    given, the first rule that yields a split with both parts in vocab and a
+    score reaching it ends the search, and that rule's best such split is
+    returned without running the remaining rules.
     """
-    possible_splits = find_all_splits(word)
-    if not possible_splits:
-        return [word]
-
     valid_splits = []
-    for _, splits in possible_splits.items():
-        for split_str in splits:
-            parts = [p.strip().strip("'") for p in split_str.split('+')]
-            if len(parts) == 2:
-                part1, part2 = parts
-                p1_in = part1 in vocab
-                p2_in = part2 in vocab
-                
-                score = 0
-                if p1_in and p2_in:
-                    score = 1000 + min(vocab.get(part1, 1), vocab.get(part2, 1))
-                elif p1_in or p2_in:
-                    score = 100 + (vocab.get(part1, 1) if p1_in else vocab.get(part2, 1))
-                
-                if score > 0:
-                    valid_splits.append({'parts': [part1, part2], 'score': score})
+    for _, splits in iter_splits(word):
+        # (score, part1, part2) of this rule's best early-accept candidate
+        strong_split = None
+        for part1, part2 in splits:
+            freq1 = vocab.get(part1)
+            freq2 = vocab.get(part2)
+
+            score = 0
+            if freq1 is not None and freq2 is not None:
+                score = 1000 + min(freq1, freq2)
+            elif freq1 is not None:
+                score = 100 + freq1
+            elif freq2 is not None:
+                score = 100 + freq2
+
+            if score > 0:
+                valid_splits.append({'parts': [part1, part2], 'score': score})
+                if (accept_score is not None and freq1 is not None and freq2 is not None
+                        and score >= accept_score):
+                    candidate = (score, part1, part2)
+                    # Parts break score ties so the choice does not depend on set order
+                    if strong_split is None or candidate > strong_split:
+                        strong_split = candidate
+
+        if strong_split is not None:
+            return [strong_split[1], strong_split[2]]
 
     if not valid_splits:
         return [word]
@@ -82,29 +104,70 @@ def get_best_frequency_split(word, vocab):
     best_split = max(valid_splits, key=lambda x: x['score'])
     return best_split['parts']
 
-def pre_tokenize_corpus(input_path, output_path, vocab):
+def _init_worker(vocab, accept_score):
+    """
+    Stores the read-only vocabulary in a pre-tokenization worker process.
+    """
+    global _worker_vocab, _worker_accept_score
+    _worker_vocab = vocab
+    _worker_accept_score = accept_score
+
+def _process_chunk(lines):
+    """
+    Pre-tokenizes a batch of corpus lines inside a worker process.
+    Returns the newline-terminated output lines in input order.
+    """
+    vocab = _worker_vocab
+    accept_score = _worker_accept_score
+    split_cache = _worker_split_cache
+    out_lines = []
+    for line in lines:
+        words = line.strip().split()
+        pre_tokenized_words = []
+        for word in words:
+            sub_words = word.replace('\u200c', ' ').split()
+            for sub_word in sub_words:
+                split_parts = split_cache.get(sub_word)
+                if split_parts is None:
+                    # Interned so the cache shares one object per distinct string
+                    split_parts = tuple(sys.intern(p) for p in
+                                        get_best_frequency_split(sub_word, vocab, accept_score))
+                    split_cache[sys.intern(sub_word)] = split_parts
+                pre_tokenized_words.extend(split_parts)
+        out_lines.append(' '.join(pre_tokenized_words) + '\n')
+    return out_lines
+
+def pre_tokenize_corpus(input_path, output_path, vocab, workers=None, chunk_size=5000):
     """
     Reads corpus, applies best splits, and saves pre-tokenized text.
+    Lines are split into chunks and processed by a pool of worker processes.
     """
-    print(f"[INFO] Pre-tokenizing '{input_path}'...")
-    
+    workers = workers or os.cpu_count() or 1
+    # A split with both parts in vocab whose smaller frequency exceeds half the
+    # top frequency ends the search at the rule that produced it
+    accept_score = 1000 + max(vocab.values(), default=0) / 2
+    print(f"[INFO] Pre-tokenizing '{input_path}' with {workers} worker(s)...")
+
     with open(input_path, 'r', encoding='utf-8') as infile, \
-         open(output_path, 'w', encoding='utf-8') as outfile:
-        
-        for i, line in enumerate(infile):
-            words = line.strip().split()
-            pre_tokenized_words = []
-            for word in words:
-                sub_words = word.replace('\u200c', ' ').split()
-                for sub_word in sub_words:
-                    split_parts = get_best_frequency_split(sub_word, vocab)
-                    pre_tokenized_words.extend(split_parts)
-            
-            outfile.write(' '.join(pre_tokenized_words) + '\n')
-            
-            if (i + 1) % 1000 == 0:
-                print(f"  ...processed {i+1} lines", end='\r')
-                
+         open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as outfile, \
+         ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(vocab, accept_score)) as executor:
+
+        chunks = iter(lambda: list(islice(infile, chunk_size)), [])
+        in_flight = deque()
+        lines_done = 0
+        while True:
+            # Keep a bounded number of chunks queued and write results in corpus order
+            for chunk in islice(chunks, 2 * workers - len(in_flight)):
+                in_flight.append(executor.submit(_process_chunk, chunk))
+            if not in_flight:
+                break
+
+            out_lines = in_flight.popleft().result()
+            outfile.writelines(out_lines)
+            lines_done += len(out_lines)
+            print(f"  ...processed {lines_done} lines", end='\r')
+
     print(f"\n[INFO] Pre-tokenization saved to '{output_path}'.")
 
 def train_bpe_model(input_file, model_prefix, vocab_size=16000):
@@ -112,13 +175,20 @@ def train_bpe_model(input_file, model_prefix, vocab_size=16000):
     Trains the SentencePiece BPE model.
     """
     print(f"[INFO] Training BPE model (Vocab Size: {vocab_size})...")
-    spm.SentencePieceTrainer.train(
+    # Sample at most 2M sentences so memory stays bounded on large corpora
+    train_args = (
         f'--input={input_file} '
         f'--model_prefix={model_prefix} '
         f'--vocab_size={vocab_size} '
         f'--model_type=bpe '
-        f'--character_coverage=1.0'
+        f'--character_coverage=1.0 '
+        f'--input_sentence_size=2000000 '
+        f'--shuffle_input_sentence=true '
+        f'--num_threads={os.cpu_count() or 1}'
     )
+    if os.path.getsize(input_file) > 2 << 30:
+        train_args += ' --train_extremely_large_corpus=true'
+    spm.SentencePieceTrainer.train(train_args)
     print(f"[SUCCESS] Model saved as '{model_prefix}.model'")
 
 def main():
@@ -127,6 +197,7 @@ def main():
     parser.add_argument("--corpus", required=True, help="Path to corpus file (telugu_corpus.txt)")
     parser.add_argument("--output_dir", default="model", help="Directory to save model")
     parser.add_argument("--vocab_size", type=int, default=16000, help="BPE Vocabulary size")
+    parser.add_argument("--workers", type=int, default=None, help="Pre-tokenization processes (default: CPU count)")
 
     args = parser.parse_args()
 
@@ -139,7 +210,7 @@ def main():
     vocabulary = load_vocabulary_with_frequency(args.vocab)
 
     # Step 2: Pre-tokenize
-    pre_tokenize_corpus(args.corpus, pretokenized_corpus, vocabulary)
+    pre_tokenize_corpus(args.corpus, pretokenized_corpus, vocabulary, args.workers)
 
     # Step 3: Train Model
     train_bpe_model(pretokenized_corpus, model_prefix, args.vocab_size)